@@ -0,0 +1,76 @@
+"""วัดเวลาโจมตีวงกว้างในโหมดจู่โจม: อาเรย์ NumPy เทียบกับลูป Character ทีละตัว
+
+รัน: python bench_raid.py
+"""
+import random
+import time
+import numpy as np
+from rules import Character, CharacterType
+from raid import Raid
+
+SIZES = (100, 1000, 10000)
+REPEATS = 20
+
+
+def make_raid(size):
+    raid = Raid()
+    raid.add_group(CharacterType.HERO, "ฮีโร่", 1, 10 ** 9, 10 ** 9, 80, 30)
+    raid.add_group(CharacterType.MONSTER, "ก็อบลิน", size - 1, 10 ** 9, 20, 10, 5)
+    return raid
+
+
+def make_characters(size):
+    hero = Character("ฮีโร่", CharacterType.HERO, 10 ** 9, 10 ** 9, 80, 30)
+    monsters = [Character(f"ก็อบลิน{i}", CharacterType.MONSTER, 10 ** 9, 20, 10, 5) for i in range(size - 1)]
+    return hero, monsters
+
+
+def loop_area_attack(attacker, targets):
+    """กติกาเดียวกับ !โจมตี แต่วนทีละเป้าหมาย"""
+    roll = random.randint(1, 20)
+    mp_bonus = 1 + (attacker.mp / attacker.max_mp) * 0.5
+    accuracy = 0.5 + (attacker.mental / 200)
+    for target in targets:
+        attack_count = 1
+        if attacker.speed > target.speed + 10:
+            attack_count = 2
+        if attacker.speed > target.speed + 20:
+            attack_count = 3
+        total_damage = 0
+        for _ in range(attack_count):
+            if random.random() > accuracy:
+                continue
+            damage = int(max(1, roll // 3) * mp_bonus)
+            if roll == 20:
+                damage *= 2
+            total_damage += damage
+        target.hp = max(0, target.hp - int(total_damage * attacker.calculate_attack_bonus(target)))
+    attacker.mp = max(0, attacker.mp - max(5, int(attacker.max_mp * 0.1)))
+
+
+def timeit(func):
+    best = float('inf')
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    rng = np.random.default_rng()
+    print(f"{'จำนวน':>8} {'NumPy (ms)':>12} {'ลูป (ms)':>12} {'เร็วขึ้น':>9}")
+    for size in SIZES:
+        raid = make_raid(size)
+        targets = raid.alive_enemies(0)
+        attackers = np.zeros(len(targets), dtype=np.int64)
+        vectorized = timeit(lambda: raid.resolve_attacks(attackers, targets, rng.integers(1, 21), rng))
+
+        hero, monsters = make_characters(size)
+        looped = timeit(lambda: loop_area_attack(hero, monsters))
+
+        print(f"{size:>8} {vectorized:>12.3f} {looped:>12.3f} {looped / vectorized:>8.1f}x")
+
+
+if __name__ == '__main__':
+    main()
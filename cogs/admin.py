@@ -0,0 +1,84 @@
+import importlib
+import time
+import discord
+from discord.ext import commands
+import raid
+import registry
+import rules
+
+
+# คำสั่งสำหรับผู้ดูแลบอท
+class Admin(commands.Cog):
+    def __init__(self, bot):
+        self.bot = bot
+
+    def _session_id(self):
+        ws = self.bot.ws
+        return getattr(ws, 'session_id', None)
+
+    @commands.command(name='รีโหลด')
+    @commands.is_owner()
+    async def reload(self, ctx):
+        """โหลดกติกาและคำสั่งใหม่โดยไม่ตัดการเชื่อมต่อและไม่ล้างการต่อสู้"""
+        session_before = self._session_id()
+        start = time.perf_counter()
+
+        # โหลด cog ใหม่ก่อน (cog อ้างคลาสผ่าน rules.X ตอนเรียกใช้ จึงใช้ได้กับกติกาทั้งชุดเก่าและใหม่)
+        # cog ที่โหลดไม่ผ่าน discord.py จะคืนสู่เวอร์ชันก่อนหน้าให้เอง
+        reloaded = []
+        failed = []
+        for name in list(self.bot.extensions):
+            try:
+                await self.bot.reload_extension(name)
+                reloaded.append(name)
+            except commands.ExtensionError as error:
+                failed.append((name, error))
+
+        # โหลดกติกาใหม่เมื่อ cog ทุกตัวผ่านเท่านั้น และต้องผ่านทั้ง rules และ raid
+        # ถ้าตัวใดไม่ผ่านจะคืนทั้งสองโมดูลเป็นชุดเดิม เพื่อไม่ให้ Enum สองชุดปนกัน
+        if not failed:
+            saved = {module: dict(module.__dict__) for module in (rules, raid)}
+            for module in (rules, raid):
+                try:
+                    importlib.reload(module)
+                except Exception as error:
+                    failed.append((module.__name__, error))
+                    for old_module, namespace in saved.items():
+                        old_module.__dict__.clear()
+                        old_module.__dict__.update(namespace)
+                    break
+        rebound = registry.rebind_rules()
+
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        session_after = self._session_id()
+        continuous = session_before is not None and session_before == session_after
+
+        embed = discord.Embed(
+            title="♻️ รีโหลดเรียบร้อย" if not failed else "⚠️ รีโหลดไม่สำเร็จบางส่วน",
+            description="\n".join(f"- `{name}`" for name in reloaded) or "ไม่มี extension ที่โหลดใหม่",
+            color=0xff0000 if failed else 0x00ff00 if continuous else 0xffa500
+        )
+        if failed:
+            embed.add_field(
+                name="❌ โหลดไม่ผ่าน",
+                value="\n".join(f"- `{name}`: {error}" for name, error in failed)[:1024],
+                inline=False
+            )
+        embed.add_field(name="⏱️ เวลาที่ใช้", value=f"{elapsed_ms:.1f} ms", inline=True)
+        embed.add_field(name="📡 Latency", value=f"{self.bot.latency * 1000:.0f} ms", inline=True)
+        embed.add_field(
+            name="🔌 การเชื่อมต่อ Gateway",
+            value="ต่อเนื่อง (session เดิม)" if continuous else "session เปลี่ยน",
+            inline=True
+        )
+        embed.add_field(
+            name="⚔️ การต่อสู้ที่คงอยู่",
+            value=f"{len(registry.battles)} การต่อสู้ / {len(registry.raids)} การจู่โจม / {rebound} ตัวละคร",
+            inline=False
+        )
+        print(f'รีโหลด {len(reloaded)} extension (ไม่ผ่าน {len(failed)}) ใน {elapsed_ms:.1f} ms (session เดิม: {continuous})')
+        await ctx.send(embed=embed)
+
+
+async def setup(bot):
+    await bot.add_cog(Admin(bot))
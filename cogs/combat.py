@@ -0,0 +1,699 @@
+import discord
+import random
+from discord.ext import commands
+import rules
+from rules import HP_EMOJI, MP_EMOJI, MENTAL_EMOJI, DICE_EMOJI
+from registry import battles, get_battle, get_turn_settings, idle_streaks, set_turn_settings, turn_timers
+
+
+# คำสั่งการต่อสู้ทั้งหมด (โหลดใหม่ได้ด้วย !รีโหลด)
+class Combat(commands.Cog):
+    def __init__(self, bot):
+        self.bot = bot
+
+    async def cog_load(self):
+        # วงล้อเวลาอยู่ใน registry จึงคงอยู่ข้ามการรีโหลด เปลี่ยนแค่ตัวจัดการ
+        turn_timers.handler = self.on_turn_timeout
+        turn_timers.start()
+
+    def _arm_turn_timer(self, channel_id, idle=False):
+        """เริ่มนับเวลาของตาปัจจุบันใหม่ (เรียกทุกครั้งที่เปลี่ยนตา)
+
+        idle=True เมื่อเปลี่ยนตาเพราะหมดเวลา นอกนั้นถือว่ามีผู้เล่นอยู่และล้างตัวนับ
+        """
+        if not idle:
+            idle_streaks.pop(channel_id, None)
+        timeout, _ = get_turn_settings(channel_id)
+        if timeout > 0:
+            turn_timers.schedule(channel_id, timeout)
+        else:
+            turn_timers.cancel(channel_id)
+
+    async def on_turn_timeout(self, channel_id):
+        """ผู้เล่นไม่ทำอะไรจนหมดเวลา: ข้ามตาหรือโจมตีอัตโนมัติ"""
+        try:
+            await self._handle_turn_timeout(channel_id)
+        except Exception as error:
+            # ทำงานใน background task จึงต้องรายงานข้อผิดพลาดเอง
+            print(f'เกิดข้อผิดพลาดตอนหมดเวลา (ช่อง {channel_id}): {error!r}')
+
+    async def _handle_turn_timeout(self, channel_id):
+        battle = battles.get(channel_id)
+        channel = self.bot.get_channel(channel_id)
+        # ถูกตั้งเวลาใหม่แล้ว (มีคนเล่นตาไปแล้ว) หรือการต่อสู้จบแล้ว
+        if (turn_timers.is_pending(channel_id) or not battle or not battle.is_active
+                or not battle.turn_order or channel is None):
+            return
+
+        current_char = battle.turn_order[battle.current_turn]
+        await channel.send(f"⌛ {current_char.get_icon()} {current_char.name} หมดเวลา!")
+
+        # ระหว่างรอส่งข้อความ ผู้เล่นอาจเล่นตานี้ไปแล้ว ต้องตรวจซ้ำก่อนแก้สถานะ
+        if (turn_timers.is_pending(channel_id) or not battle.is_active or not battle.turn_order
+                or battle.turn_order[battle.current_turn] is not current_char):
+            return
+
+        _, action = get_turn_settings(channel_id)
+        targets = [char for char in battle.participants
+                   if char.team != current_char.team and char.hp > 0]
+        idle_streaks[channel_id] = idle_streaks.get(channel_id, 0) + 1
+
+        # ตัวละครที่ HP หมดแล้วข้ามตาเสมอ ไม่โจมตีอัตโนมัติ
+        if action == 'โจมตี' and targets and current_char.hp > 0:
+            await self._resolve_attack(channel, battle, current_char, random.choice(targets), idle=True)
+        else:
+            await self._skip(channel, battle, current_char, idle=True)
+
+        # ทุกตัวละครหมดเวลาครบหนึ่งรอบ: หยุดนับเวลาจนกว่าจะมีคนเล่นต่อ
+        if battle.is_active and idle_streaks.get(channel_id, 0) >= len(battle.turn_order):
+            idle_streaks.pop(channel_id, None)
+            turn_timers.cancel(channel_id)
+            await channel.send("⏸️ ไม่มีใครเล่นครบหนึ่งรอบ หยุดนับเวลาชั่วคราว ใช้ !โจมตี หรือ !ผ่าน เพื่อเล่นต่อ")
+
+    async def _resolve_attack(self, channel, battle, current_char, target, idle=False):
+        """ทอยเต๋า คำนวณความเสียหาย และเดินตาถัดไป"""
+        # คำนวณค่าต่างๆ สำหรับการโจมตี
+        roll = random.randint(1, 20)
+
+        # ผลจากความเร็ว (โอกาสโจมตีหลายครั้ง)
+        attack_count = 1
+        if current_char.speed > target.speed + 10:
+            attack_count = 2
+        if current_char.speed > target.speed + 20:
+            attack_count = 3
+
+        # ผลจาก MP (เพิ่มความเสียหาย)
+        mp_bonus = 1 + (current_char.mp / current_char.max_mp) * 0.5  # โบนัสสูงสุด 1.5 เท่า
+
+        # ผลจากจิตใจ (ความแม่นยำ)
+        accuracy = 0.5 + (current_char.mental / 200)  # 50%-100% จากจิตใจ
+
+        total_damage = 0
+        attack_details = []
+
+        for _ in range(attack_count):
+            # ตรวจสอบความแม่นยำ
+            if random.random() > accuracy:
+                attack_details.append("💨 โจมตีพลาด!")
+                continue
+
+            # คำนวณความเสียหายพื้นฐาน
+            base_damage = max(1, roll // 3)
+            damage = int(base_damage * mp_bonus)
+            crit = roll == 20
+
+            if crit:
+                damage *= 2
+                attack_details.append(f"💥 **Critical Hit!** ({damage} {HP_EMOJI})")
+            elif roll >= 15:
+                attack_details.append(f"✨ โจมตีอย่างมีประสิทธิภาพ! ({damage} {HP_EMOJI})")
+            elif roll >= 10:
+                attack_details.append(f"⚔️ โจมตีสำเร็จ ({damage} {HP_EMOJI})")
+            elif roll >= 5:
+                attack_details.append(f"🤕 โจมตีได้ผลน้อย ({damage} {HP_EMOJI})")
+
+            total_damage += damage
+
+        # ลด MP หลังโจมตี
+        mp_cost = max(5, int(current_char.max_mp * 0.1))
+        current_char.mp = max(0, current_char.mp - mp_cost)
+
+        # เลือกคำกริยาโจมตี
+        attack_verbs = {
+            rules.CharacterType.HERO: ["โจมตี", "เข้าต่อสู้กับ", "พุ่งเข้าหา"],
+            rules.CharacterType.ANTI_HERO: ["ซุ่มโจมตี", "จู่โจม", "ทำร้าย"],
+            rules.CharacterType.VILLAIN: ["กระหน่ำ", "สาปแช่ง", "โจมตี"],
+            rules.CharacterType.MONSTER: ["กัด", "ขย้ำ", "ถล่ม"]
+        }
+        verb = random.choice(attack_verbs.get(current_char.char_type, ["โจมตี"]))
+
+        # สร้าง narrative
+        narrative = f"{current_char.get_icon()} {current_char.name} {verb} {target.get_icon()} {target.name} ({DICE_EMOJI} {roll}):\n"
+        narrative += "\n".join(attack_details)
+
+        if total_damage > 0:
+            target.hp = max(0, target.hp - total_damage)
+            narrative += f"\nรวมความเสียหาย: {total_damage} {HP_EMOJI}"
+
+            if target.hp <= 0:
+                narrative += f"\n💀 {target.get_icon()} {target.name} ถูกกำจัดแล้ว!"
+
+        battle.add_narrative(narrative)
+
+        # ตรวจสอบผลการต่อสู้
+        battle_result = battle.check_battle_end()
+        if battle_result:
+            embed = discord.Embed(
+                title=f"🏆 {battle_result} 🏆",
+                description=battle.get_narrative(),
+                color=0x00ff00 if "ฮีโร่" in battle_result else 0xff0000
+            )
+            battle.is_active = False
+            battle.take_snapshot()
+            turn_timers.cancel(channel.id)
+            await channel.send(embed=embed)
+            return
+
+        next_char = battle.next_turn()
+        battle.take_snapshot()
+        self._arm_turn_timer(channel.id, idle)
+
+        embed = discord.Embed(
+            title="📜 อัพเดทการต่อสู้",
+            description=battle.get_narrative(),
+            color=0x7289da
+        )
+        await channel.send(embed=embed)
+        await channel.send(embed=battle.get_status_embed())
+        await channel.send(f"**ตาถัดไป:** {next_char.get_icon()} {next_char.name}")
+
+    async def _skip(self, channel, battle, current_char, idle=False):
+        """ข้ามตาของตัวละครปัจจุบัน"""
+        next_char = battle.next_turn()
+        self._arm_turn_timer(channel.id, idle)
+        battle.add_narrative(f"⏭️ {current_char.name} ข้ามตา")
+        # ข้ามตาอัตโนมัติไม่เพิ่มประวัติ แค่เขียนทับ snapshot ล่าสุด
+        battle.take_snapshot(replace=idle)
+
+        embed = discord.Embed(
+            title="⏩ ข้ามตา",
+            description=battle.get_narrative(),
+            color=0xffff00
+        )
+        await channel.send(embed=embed)
+        await channel.send(embed=battle.get_status_embed())
+        await channel.send(f"**ตาถัดไป:** {next_char.get_icon()} {next_char.name}")
+
+    @commands.command(name='สร้างตัวละคร')
+    async def create_character(self, ctx, char_type: str, name: str, hp: int, mp: int, mental: int, speed: int):
+        """สร้างตัวละครใหม่ (ฮีโร่/ผู้ไม่หวังดี/วายร้าย/สัตว์ประหลาด)"""
+        battle = get_battle(ctx.channel.id)
+        try:
+            # สร้าง mapping สำหรับคำไทย
+            type_mapping = {
+                "ฮีโร่": "HERO",
+                "ผู้ไม่หวังดี": "ANTI_HERO",
+                "วายร้าย": "VILLAIN",
+                "สัตว์ประหลาด": "MONSTER"
+            }
+
+            # ตรวจสอบว่าผู้ใช้ป้อนคำไทยหรือภาษาอังกฤษ
+            if char_type in type_mapping:
+                char_type_enum = rules.CharacterType[type_mapping[char_type]]
+            else:
+                # ถ้าไม่ใช่คำไทย ให้ลองแปลงเป็น enum โดยตรง
+                char_type_enum = rules.CharacterType[char_type.upper()]
+
+        except KeyError:
+            await ctx.send("⚠️ ประเภทตัวละครไม่ถูกต้อง! ใช้: ฮีโร่, ผู้ไม่หวังดี, วายร้าย หรือ สัตว์ประหลาด")
+            return
+
+        # ส่วนที่เหลือของฟังก์ชันเหมือนเดิม
+        if battle.is_active:
+            await ctx.send("⛔ ไม่สามารถสร้างตัวละครระหว่างการต่อสู้ได้!")
+            return
+
+        if any(char.name.lower() == name.lower() for char in battle.participants):
+            await ctx.send("⚠️ มีตัวละครชื่อนี้อยู่แล้ว!")
+            return
+
+        character = rules.Character(
+            name=name,
+            char_type=char_type_enum,
+            hp=hp,
+            mp=mp,
+            mental=mental,
+            speed=speed
+        )
+
+        if char_type_enum in [rules.CharacterType.HERO, rules.CharacterType.ANTI_HERO]:
+            character.owner = ctx.author.id
+
+        battle.add_participant(character)
+        battle.take_snapshot()
+
+        await ctx.send(
+            f"✅ สร้างตัวละคร {char_type_enum.value} ชื่อ {name} สำเร็จ!\n"
+            f"{HP_EMOJI} HP: {hp} | {MP_EMOJI} MP: {mp}\n"
+            f"{MENTAL_EMOJI} จิตใจ: {mental} | 🏃 ความเร็ว: {speed}"
+        )
+
+
+    @commands.command(name='ลบตัวละคร')
+    async def remove_character(self, ctx, name: str):
+        """ลบตัวละครออกจากการต่อสู้"""
+        battle = get_battle(ctx.channel.id)
+        # หาตัวละครจากชื่อ
+        char_to_remove = None
+        for char in battle.participants:
+            if char.name.lower() == name.lower():
+                char_to_remove = char
+                break
+
+        if not char_to_remove:
+            await ctx.send(f"⚠️ ไม่พบตัวละครชื่อ '{name}'")
+            return
+
+        was_current = bool(battle.turn_order) and battle.turn_order[battle.current_turn] is char_to_remove
+
+        # ลบตัวละครออก
+        battle.participants.remove(char_to_remove)
+
+        # ถ้าตัวละครที่ลบอยู่ในลำดับการเล่น
+        if char_to_remove in battle.turn_order:
+            # หาตำแหน่งใน turn_order
+            index = battle.turn_order.index(char_to_remove)
+
+            # ลบออกจาก turn_order
+            battle.turn_order.remove(char_to_remove)
+
+            # ปรับ current_turn ถ้าจำเป็น
+            if battle.current_turn >= index and battle.current_turn > 0:
+                battle.current_turn -= 1
+
+        battle.take_snapshot()
+        await ctx.send(f"✅ ลบตัวละคร {char_to_remove.get_icon()} {char_to_remove.name} ออกเรียบร้อย")
+
+        # อัพเดทสถานะ
+        if battle.is_active:
+            # เริ่มนับเวลาใหม่เฉพาะเมื่อตาปัจจุบันเปลี่ยนไป
+            if not battle.turn_order:
+                turn_timers.cancel(ctx.channel.id)
+            elif was_current:
+                self._arm_turn_timer(ctx.channel.id)
+            await ctx.send(embed=battle.get_status_embed())
+
+
+
+    @commands.command(name='เพิ่มตัวละคร')
+    async def add_character(self, ctx, char_type: str, name: str, hp: int, mp: int, mental: int, speed: int):
+        """เพิ่มตัวละครใหม่ระหว่างเกม"""
+        battle = get_battle(ctx.channel.id)
+        try:
+            # สร้าง mapping สำหรับคำไทย
+            type_mapping = {
+                "ฮีโร่": "HERO",
+                "ผู้ไม่หวังดี": "ANTI_HERO",
+                "วายร้าย": "VILLAIN",
+                "สัตว์ประหลาด": "MONSTER"
+            }
+
+            # ตรวจสอบว่าผู้ใช้ป้อนคำไทยหรือภาษาอังกฤษ
+            if char_type in type_mapping:
+                char_type_enum = rules.CharacterType[type_mapping[char_type]]
+            else:
+                # ถ้าไม่ใช่คำไทย ให้ลองแปลงเป็น enum โดยตรง
+                char_type_enum = rules.CharacterType[char_type.upper()]
+
+        except KeyError:
+            await ctx.send("⚠️ ประเภทตัวละครไม่ถูกต้อง! ใช้: ฮีโร่, ผู้ไม่หวังดี, วายร้าย หรือ สัตว์ประหลาด")
+            return
+
+        if any(char.name.lower() == name.lower() for char in battle.participants):
+            await ctx.send("⚠️ มีตัวละครชื่อนี้อยู่แล้ว!")
+            return
+
+        character = rules.Character(
+            name=name,
+            char_type=char_type_enum,
+            hp=hp,
+            mp=mp,
+            mental=mental,
+            speed=speed
+        )
+
+        if char_type_enum in [rules.CharacterType.HERO, rules.CharacterType.ANTI_HERO]:
+            character.owner = ctx.author.id
+
+        battle.add_participant(character)
+        battle.take_snapshot()
+
+        # แจ้งเตือนการเพิ่มตัวละคร
+        embed = discord.Embed(
+            title=f"✅ เพิ่มตัวละคร {char_type_enum.value} สำเร็จ",
+            description=(
+                f"{character.get_icon()} **ชื่อ:** {name}\n"
+                f"{HP_EMOJI} **HP:** {hp} | {MP_EMOJI} **MP:** {mp}\n"
+                f"{MENTAL_EMOJI} **จิตใจ:** {mental} | 🏃 **ความเร็ว:** {speed}"
+            ),
+            color=0x00ff00
+        )
+
+        await ctx.send(embed=embed)
+
+        # ถ้าการต่อสู้กำลังดำเนินอยู่ ให้อัพเดทสถานะ
+        if battle.is_active:
+            battle.update_turn_order()
+            await ctx.send(embed=battle.get_status_embed())
+            await ctx.send(f"**ตาปัจจุบัน:** {battle.turn_order[battle.current_turn].name}")
+
+    @commands.command(name='เริ่มการต่อสู้')
+    async def start_battle(self, ctx):
+        """เริ่มการต่อสู้"""
+        battle = get_battle(ctx.channel.id)
+        heroes = battle.get_team_members("ฝ่ายฮีโร่")
+        villains = battle.get_team_members("ฝ่ายวายร้าย")
+
+        if not heroes or not villains:
+            await ctx.send("ต้องการตัวละครฝ่ายฮีโร่และฝ่ายวายร้ายอย่างน้อย 1 ตัวเพื่อเริ่มการต่อสู้!")
+            return
+
+        battle.is_active = True
+        battle.update_turn_order()
+        battle.take_snapshot()
+
+        # แนะนำทีม
+        hero_names = ", ".join([f"{char.get_icon()} {char.name}" for char in heroes])
+        villain_names = ", ".join([f"{char.get_icon()} {char.name}" for char in villains])
+
+        turn_order = " → ".join([f"{char.get_icon()} {char.name}" for char in battle.turn_order])
+
+        embed = discord.Embed(
+            title="⚔️ การต่อสู้เริ่มต้นขึ้น! ⚔️",
+            description=f"**ฝ่ายฮีโร่:** {hero_names}\n**ฝ่ายวายร้าย:** {villain_names}",
+            color=0xff0000
+        )
+        embed.add_field(name="ลำดับตา", value=turn_order, inline=False)
+        embed.set_footer(text=f"ตาแรก: {battle.turn_order[0].name}")
+
+        await ctx.send(embed=embed)
+        await ctx.send(embed=battle.get_status_embed())
+        self._arm_turn_timer(ctx.channel.id)
+
+
+    @commands.command(name='โจมตี')
+    async def attack(self, ctx, target_name: str = None):
+        """โจมตีเป้าหมาย"""
+        battle = get_battle(ctx.channel.id)
+        if not battle.is_active:
+            await ctx.send("⛔ ยังไม่ได้เริ่มการต่อสู้!")
+            return
+
+        current_char = battle.turn_order[battle.current_turn]
+
+        possible_targets = [char for char in battle.participants 
+                          if char.team != current_char.team and char.hp > 0]
+
+        if not target_name:
+            if len(possible_targets) == 1:
+                target = possible_targets[0]
+            else:
+                target_list = "\n".join([f"- {char.name}" for char in possible_targets])
+                await ctx.send(f"📝 โปรดระบุเป้าหมายจาก:\n{target_list}")
+                return
+        else:
+            target = battle.get_target(target_name)
+            if not target or target.team == current_char.team:
+                await ctx.send("⚠️ เป้าหมายไม่ถูกต้อง!")
+                return
+
+        await self._resolve_attack(ctx.channel, battle, current_char, target)
+
+    # เพิ่มคำสั่งเลือกตัวละคร
+    @commands.command(name='เลือก')
+    async def select_character(self, ctx, name: str):
+        """เลือกตัวละครที่จะควบคุม"""
+        battle = get_battle(ctx.channel.id)
+        char = battle.get_target(name)
+        if not char:
+            await ctx.send("⚠️ ไม่พบตัวละครนี้!")
+            return
+
+        # ในระบบใหม่นี้ ไม่จำเป็นต้องตรวจสอบ owner
+        await ctx.send(f"✅ คุณเลือก {char.get_icon()} {char.name} แล้ว")
+    @commands.command(name='ลำดับ')
+    async def turn_order(self, ctx):
+        """แสดงลำดับการเล่น"""
+        battle = get_battle(ctx.channel.id)
+        if not battle.is_active:
+            await ctx.send("⛔ ยังไม่ได้เริ่มการต่อสู้!")
+            return
+
+        order = "\n".join(
+            f"{i+1}. {char.get_icon()} {char.name} (ความเร็ว: {char.speed})"
+            for i, char in enumerate(battle.turn_order)
+        )
+
+        embed = discord.Embed(
+            title="🔄 ลำดับการเล่น",
+            description=order,
+            color=0x00ffff
+        )
+        embed.set_footer(text=f"ตาปัจจุบัน: {battle.current_turn + 1}")
+        await ctx.send(embed=embed)
+
+    @commands.command(name='สถานะ')
+    async def status(self, ctx):
+        """แสดงสถานะการต่อสู้ปัจจุบัน"""
+        battle = get_battle(ctx.channel.id)
+        if not battle.participants:
+            await ctx.send("ℹ️ ยังไม่มีการต่อสู้")
+            return
+
+        await ctx.send(embed=battle.get_status_embed())
+
+    @commands.command(name='เป้าหมาย')
+    async def list_targets(self, ctx):
+        """แสดงรายการเป้าหมาย"""
+        battle = get_battle(ctx.channel.id)
+        user_chars = battle.get_characters_by_owner(ctx.author.id)
+        if not user_chars:
+            await ctx.send("⚠️ คุณไม่มีตัวละครในการต่อสู้นี้!")
+            return
+
+        team = user_chars[0].team
+        enemies = [char for char in battle.participants 
+                   if char.team != team and char.hp > 0]
+
+        if not enemies:
+            await ctx.send("🎉 ไม่มีศัตรูเหลืออยู่แล้ว!")
+            return
+
+        embed = discord.Embed(title="🎯 เป้าหมายที่มี", color=0xff0000)
+        for enemy in enemies:
+            embed.add_field(
+                name=f"{enemy.get_icon()} {enemy.name} ({enemy.char_type.value})",
+                value=f"{HP_EMOJI} {enemy.hp}/{enemy.max_hp} {battle.get_status_emoji(enemy.hp, enemy.max_hp)}\nจิตใจ: {enemy.mental}/100",
+                inline=True
+            )
+
+        await ctx.send(embed=embed)
+
+    @commands.command(name='ผ่าน')
+    async def skip_turn(self, ctx):
+        """ข้ามตา"""
+        battle = get_battle(ctx.channel.id)
+        if not battle.is_active:
+            await ctx.send("⛔ ยังไม่ได้เริ่มการต่อสู้!")
+            return
+
+        current_char = battle.turn_order[battle.current_turn]
+        if current_char.owner != ctx.author.id:
+            await ctx.send("⏳ ยังไม่ใช่ตาของคุณ!")
+            return
+
+        await self._skip(ctx.channel, battle, current_char)
+
+    @commands.command(name='ตั้งเวลา')
+    @commands.has_guild_permissions(manage_guild=True)
+    async def set_turn_timeout(self, ctx, seconds: int, action: str = 'ผ่าน'):
+        """(GM) ตั้งเวลาต่อตา (0 = ปิด) และสิ่งที่ทำเมื่อหมดเวลา (ผ่าน/โจมตี)"""
+        if seconds < 0 or action not in ('ผ่าน', 'โจมตี'):
+            await ctx.send("⚠️ ใช้: !ตั้งเวลา <วินาที> [ผ่าน/โจมตี] (0 = ไม่จำกัดเวลา)")
+            return
+
+        set_turn_settings(ctx.channel.id, seconds, action)
+        battle = get_battle(ctx.channel.id)
+        if battle.is_active:
+            self._arm_turn_timer(ctx.channel.id)
+
+        if seconds == 0:
+            await ctx.send("✅ ปิดการจำกัดเวลาต่อตาแล้ว")
+        else:
+            await ctx.send(f"✅ ตั้งเวลาต่อตา {seconds} วินาที เมื่อหมดเวลาจะ{action}อัตโนมัติ")
+
+    @commands.command(name='ย้อนกลับ')
+    @commands.has_guild_permissions(manage_guild=True)
+    async def undo(self, ctx, steps: int = 1):
+        """(GM) ย้อนการต่อสู้กลับไป n ขั้น (ตาหรือการแก้ไขตัวละคร)"""
+        battle = get_battle(ctx.channel.id)
+        if len(battle.history) <= 1:
+            await ctx.send("ℹ️ ยังไม่มีประวัติให้ย้อนกลับ")
+            return
+        if not battle.undo(steps):
+            await ctx.send(f"⚠️ ย้อนกลับได้ 1 ถึง {len(battle.history) - 1} ขั้นเท่านั้น")
+            return
+
+        if battle.is_active:
+            self._arm_turn_timer(ctx.channel.id)
+        else:
+            turn_timers.cancel(ctx.channel.id)
+
+        await ctx.send(f"⏪ ย้อนกลับ {steps} ขั้นเรียบร้อย")
+        if battle.participants:
+            await ctx.send(embed=battle.get_status_embed())
+        if battle.is_active:
+            current_char = battle.turn_order[battle.current_turn]
+            await ctx.send(f"**ตาปัจจุบัน:** {current_char.get_icon()} {current_char.name}")
+
+    @commands.command(name='จบการต่อสู้')
+    async def end_battle(self, ctx):
+        """จบการต่อสู้"""
+        battle = get_battle(ctx.channel.id)
+        battle.__init__()
+        turn_timers.cancel(ctx.channel.id)
+        idle_streaks.pop(ctx.channel.id, None)
+        await ctx.send("═══════════════\nการต่อสู้จบลง\n═══════════════")
+
+    @commands.command(name='ช่วยเหลือ')
+    async def help_command(self, ctx):
+        """แสดงคำสั่งทั้งหมดและวิธีการใช้งาน"""
+        help_embed = discord.Embed(
+            title="📜 คู่มือคำสั่ง RPG Battle Bot",
+            description="คำสั่งทั้งหมดและวิธีการใช้งานบอทจัดการการต่อสู้แบบโรลเพลย์\n"
+                        "────────────────────────────",
+            color=0x7289da
+        )
+
+        # ส่วนคำสั่งสร้างและจัดการตัวละคร
+        help_embed.add_field(
+            name="🛠️ คำสั่งสร้างและจัดการตัวละคร",
+            value=(
+                "`!สร้างตัวละคร <ประเภท> <ชื่อ> <HP> <MP> <จิตใจ> <ความเร็ว>`\n"
+                "สร้างตัวละครใหม่\n"
+                "▶ ตัวอย่าง: `!สร้างตัวละคร ฮีโร่ อาเธอร์ 100 50 80 15`\n"
+                "▶ ประเภทตัวละคร: ฮีโร่, ผู้ไม่หวังดี, วายร้าย, สัตว์ประหลาด\n\n"
+                "!ลบตัวละคร <ชื่อตัวละคร>"
+                "!พิ่มตัวละคร <ประเภท> <ชื่อ> <HP> <MP> <จิตใจ> <ความเร็ว>"
+
+
+
+            ),
+            inline=False
+        )
+
+        # ส่วนคำสั่งการต่อสู้
+        help_embed.add_field(
+            name="⚔️ คำสั่งการต่อสู้",
+            value=(
+                "`!เริ่มการต่อสู้`\n"
+                "เริ่มเกมการต่อสู้เมื่อมีตัวละครทั้งสองฝ่าย\n"
+                "▶ ตัวอย่าง: `!เริ่มการต่อสู้`\n\n"
+
+                "`!โจมตี <ชื่อเป้าหมาย>`\n"
+                "โจมตีศัตรู (ระบุชื่อเมื่อมีหลายศัตรู)\n"
+                "▶ ตัวอย่าง: `!โจมตี มังกร` หรือ `!โจมตี` (เมื่อมีศัตรูคนเดียว)\n\n"
+
+                "`!ผ่าน`\n"
+                "ข้ามตาไป\n"
+                "▶ ตัวอย่าง: `!ผ่าน`\n\n"
+
+                "`!สถานะ`\n"
+                "แสดงสถานะปัจจุบันของการต่อสู้\n"
+                "▶ ตัวอย่าง: `!สถานะ`\n\n"
+
+                "`!เป้าหมาย`\n"
+                "แสดงรายการศัตรูทั้งหมด\n"
+                "▶ ตัวอย่าง: `!เป้าหมาย`\n\n"
+
+                "`!ลำดับ`\n"
+                "แสดงลำดับการเล่นของตัวละคร\n"
+                "▶ ตัวอย่าง: `!ลำดับ`\n\n"
+
+                "`!ตั้งเวลา <วินาที> [ผ่าน/โจมตี]` (เฉพาะ GM)\n"
+                "จำกัดเวลาต่อตา หมดเวลาแล้วข้ามตาหรือโจมตีอัตโนมัติ (ค่าเริ่มต้นปิด, 0 = ปิด)\n"
+                "ถ้าทุกตัวละครหมดเวลาครบหนึ่งรอบจะหยุดนับเวลาจนกว่าจะมีคนเล่นต่อ\n"
+                "▶ ตัวอย่าง: `!ตั้งเวลา 60 โจมตี`\n"
+                "────────────────────────────"
+            ),
+            inline=False
+        )
+
+        # ส่วนคำสั่งโหมดจู่โจม
+        help_embed.add_field(
+            name="🐉 โหมดจู่โจม (ศัตรูจำนวนมาก)",
+            value=(
+                "`!เข้าร่วมจู่โจม <ประเภท> <ชื่อ> <HP> <MP> <จิตใจ> <ความเร็ว>`\n"
+                "เพิ่มตัวละครเข้าสู่การจู่โจม\n\n"
+
+                "`!เรียกฝูง <ประเภท> <ชื่อ> <จำนวน> <HP> <MP> <จิตใจ> <ความเร็ว>`\n"
+                "เรียกตัวละครหลายตัวพร้อมกัน\n"
+                "▶ ตัวอย่าง: `!เรียกฝูง สัตว์ประหลาด ก็อบลิน 300 20 10 30 5`\n\n"
+
+                "`!โจมตีวงกว้าง [ตัวละครของคุณ]` / `!โจมตีหลายเป้า [ตัวละครของคุณ] <เป้า1> <เป้า2> ...`\n"
+                "โจมตีศัตรูทุกตัวหรือหลายเป้าหมายด้วยการทอยครั้งเดียว\n"
+                "▶ ตัวละครแต่ละตัวโจมตีได้รอบละครั้ง ครบทุกตัวแล้วจะขึ้นรอบใหม่\n\n"
+
+                "`!ฝูงโจมตี` (เฉพาะ GM)\n"
+                "ศัตรูที่ยังไม่ได้โจมตีในรอบนี้โจมตีฝ่ายฮีโร่\n\n"
+
+                "`!รอบใหม่` (เฉพาะ GM)\n"
+                "เริ่มรอบใหม่ทันทีเมื่อมีผู้เล่นไม่อยู่\n\n"
+
+                "`!สถานะจู่โจม [หน้า]` / `!จบจู่โจม`\n"
+                "ดูสถานะแบบแบ่งหน้า / จบการจู่โจม\n"
+                "────────────────────────────"
+            ),
+            inline=False
+        )
+
+        # ส่วนคำสั่งจัดการเกม
+        help_embed.add_field(
+            name="🎮 คำสั่งจัดการเกม",
+            value=(
+                "`!จบการต่อสู้`\n"
+                "จบเกมการต่อสู้ปัจจุบัน\n"
+                "▶ ตัวอย่าง: `!จบการต่อสู้`\n\n"
+
+                "`!ย้อนกลับ [จำนวนขั้น]` (เฉพาะ GM)\n"
+                "ย้อนการโจมตี การข้ามตา หรือการแก้ไขตัวละครที่ผิดพลาด\n"
+                "ใช้ได้เฉพาะผู้มีสิทธิ์จัดการเซิร์ฟเวอร์\n"
+                "▶ ตัวอย่าง: `!ย้อนกลับ` หรือ `!ย้อนกลับ 3`\n\n"
+
+                "`!ช่วยเหลือ`\n"
+                "แสดงคำสั่งทั้งหมดนี้\n"
+                "▶ ตัวอย่าง: `!ช่วยเหลือ`\n\n"
+
+                "`!รีโหลด`\n"
+                "โหลดกติกาและคำสั่งใหม่โดยไม่หยุดบอท (เฉพาะเจ้าของบอท)\n"
+                "▶ ตัวอย่าง: `!รีโหลด`"
+            ),
+            inline=False
+        )
+        help_embed.add_field(
+            name="⚖️ ระบบความสัมพันธ์ตัวละคร",
+            value=(
+                "🦸 ฮีโร่ → 👿 วายร้าย (แรงขึ้น 50%)\n"
+                "👿 วายร้าย → 🦹 ผู้ไม่หวังดี (แรงขึ้น 50%)\n"
+                "🦹 ผู้ไม่หวังดี → 🦸 ฮีโร่ (แรงขึ้น 50%)\n"
+                "👹 สัตว์ประหลาด → 🦹 ผู้ไม่หวังดี (แรงขึ้น 50%)\n\n"
+                "หากโจมตีฝ่ายที่ได้เปรียบจะทำความเสียหายเพิ่ม 50%\n"
+                "หากโจมตีฝ่ายที่เสียเปรียบจะทำความเสียหายลด 30%"
+            ),
+            inline=False
+        )
+
+        help_embed.add_field(
+            name="📊 ผลของค่าสถานะ",
+            value=(
+                f"{MP_EMOJI} **MP:** ยิ่งมากยิ่งโจมตีแรง (สูงสุด 2 เท่า)\n"
+                f"{MENTAL_EMOJI} **จิตใจ:** ส่งผลต่อความแม่นยำและป้องกันสถานะผิดปกติ\n"
+                "🏃 **ความเร็ว:** อาจโจมตีได้หลายครั้งในหนึ่งตา\n"
+                "💢 **ความต่างจิตใจ:** หากต่างมากกว่า 30 หน่วยจะมีผลพิเศษ"
+            ),
+            inline=False
+        )
+
+        # ข้อความท้าย
+        help_embed.set_footer(
+            text="📌 เคล็ดลับ:\n"
+                 "- ใช้ !สถานะ เพื่อดูสถานะปัจจุบัน\n"
+                 "- ใช้ !ลำดับ เพื่อดูว่าใครเล่นตาต่อไป\n"
+                 "- สามารถโจมตีโดยไม่ต้องเลือกตัวละครก่อนในระบบใหม่"
+        )
+
+        await ctx.send(embed=help_embed)
+
+
+async def setup(bot):
+    await bot.add_cog(Combat(bot))
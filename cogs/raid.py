@@ -0,0 +1,217 @@
+import discord
+import numpy as np
+from discord.ext import commands
+import rules
+from rules import HP_EMOJI, DICE_EMOJI
+from registry import get_raid, raids
+
+# จำนวนตัวสูงสุดที่เรียกได้ในคำสั่งเดียว
+MAX_GROUP_SIZE = 10000
+
+
+# โหมดจู่โจม: ศัตรูจำนวนมาก โจมตีวงกว้างและหลายเป้าหมาย
+class RaidCommands(commands.Cog):
+    def __init__(self, bot):
+        self.bot = bot
+
+    def _parse_type(self, char_type):
+        type_mapping = {
+            "ฮีโร่": "HERO",
+            "ผู้ไม่หวังดี": "ANTI_HERO",
+            "วายร้าย": "VILLAIN",
+            "สัตว์ประหลาด": "MONSTER"
+        }
+        try:
+            return rules.CharacterType[type_mapping.get(char_type, char_type.upper())]
+        except KeyError:
+            return None
+
+    async def _add(self, ctx, char_type, name, count, hp, mp, mental, speed):
+        char_type_enum = self._parse_type(char_type)
+        if char_type_enum is None:
+            await ctx.send("⚠️ ประเภทตัวละครไม่ถูกต้อง! ใช้: ฮีโร่, ผู้ไม่หวังดี, วายร้าย หรือ สัตว์ประหลาด")
+            return
+        if not 1 <= count <= MAX_GROUP_SIZE:
+            await ctx.send(f"⚠️ จำนวนต้องอยู่ระหว่าง 1 ถึง {MAX_GROUP_SIZE}")
+            return
+
+        owner = ctx.author.id if char_type_enum in [rules.CharacterType.HERO, rules.CharacterType.ANTI_HERO] else None
+        raid = get_raid(ctx.channel.id)
+        names = raid.add_group(char_type_enum, name, count, hp, mp, mental, speed, owner)
+        if names is None:
+            await ctx.send("⚠️ มีตัวละครชื่อนี้อยู่แล้ว!")
+            return
+
+        label = names[0] if count == 1 else f"{names[0]} ... {names[-1]}"
+        await ctx.send(f"✅ เพิ่ม {char_type_enum.value} {count} ตัว ({label}) เข้าสู่การจู่โจม")
+
+    def _pick_attacker(self, ctx, raid, name=None):
+        """เลือกตัวละครของผู้ใช้ที่จะโจมตี คืน (ตำแหน่ง, ข้อความผิดพลาด)"""
+        own = raid.get_characters_by_owner(ctx.author.id)
+        if not own:
+            return None, "⚠️ คุณไม่มีตัวละครที่ยังมีชีวิตในการจู่โจมนี้!"
+        if name is not None:
+            attacker = raid.find(name)
+            if attacker not in own:
+                return None, f"⚠️ '{name}' ไม่ใช่ตัวละครของคุณที่ยังมีชีวิต!"
+        else:
+            # ไม่ระบุชื่อ: ใช้ตัวแรกที่ยังไม่ได้โจมตีในรอบนี้
+            attacker = next((i for i in own if not raid.acted[i]), own[0])
+        if raid.acted[attacker]:
+            return None, f"⏳ {raid.names[attacker]} โจมตีไปแล้วในรอบที่ {raid.round}!"
+        return attacker, None
+
+    async def _resolve_area(self, ctx, raid, attacker, targets, title):
+        """โจมตีเป้าหมายหลายตัวด้วยการทอยครั้งเดียว"""
+        roll = int(np.random.randint(1, 21))
+        damage, hits = raid.resolve_attacks(np.full(len(targets), attacker), targets, roll)
+        eliminated = int((raid.hp[targets] == 0).sum())
+
+        narrative = (
+            f"{raid.get_icon(attacker)} {raid.names[attacker]} {title} ({DICE_EMOJI} {roll}): "
+            f"โดน {int((hits > 0).sum())}/{len(targets)} เป้า "
+            f"รวม {int(damage.sum())} {HP_EMOJI}"
+        )
+        if roll == 20:
+            narrative += " 💥 **Critical Hit!**"
+        if eliminated:
+            narrative += f"\n💀 กำจัดได้ {eliminated} ตัว"
+        raid.add_narrative(narrative)
+        if raid.mark_acted([attacker]) and not raid.check_raid_end():
+            raid.add_narrative(f"🔄 เริ่มรอบที่ {raid.round}")
+        await self._send_update(ctx, raid)
+
+    async def _send_update(self, ctx, raid):
+        raid_result = raid.check_raid_end()
+        if raid_result:
+            embed = discord.Embed(
+                title=f"🏆 {raid_result} 🏆",
+                description=raid.get_narrative(),
+                color=0x00ff00 if "ฮีโร่" in raid_result else 0xff0000
+            )
+            await ctx.send(embed=embed)
+            raids.pop(ctx.channel.id, None)
+            return
+
+        embed = discord.Embed(
+            title="📜 อัพเดทการจู่โจม",
+            description=raid.get_narrative(),
+            color=0x7289da
+        )
+        await ctx.send(embed=embed)
+        await ctx.send(embed=raid.get_status_embed())
+
+    @commands.command(name='เข้าร่วมจู่โจม')
+    async def join_raid(self, ctx, char_type: str, name: str, hp: int, mp: int, mental: int, speed: int):
+        """เพิ่มตัวละครหนึ่งตัวเข้าสู่การจู่โจม"""
+        await self._add(ctx, char_type, name, 1, hp, mp, mental, speed)
+
+    @commands.command(name='เรียกฝูง')
+    async def summon_group(self, ctx, char_type: str, name: str, count: int, hp: int, mp: int, mental: int, speed: int):
+        """เพิ่มตัวละครประเภทเดียวกันหลายตัวพร้อมกัน"""
+        await self._add(ctx, char_type, name, count, hp, mp, mental, speed)
+
+    @commands.command(name='โจมตีวงกว้าง')
+    async def area_attack(self, ctx, attacker_name: str = None):
+        """โจมตีศัตรูที่ยังมีชีวิตทุกตัว (ระบุตัวละครที่จะโจมตีได้)"""
+        raid = get_raid(ctx.channel.id)
+        attacker, error = self._pick_attacker(ctx, raid, attacker_name)
+        if error:
+            await ctx.send(error)
+            return
+
+        targets = raid.alive_enemies(attacker)
+        if not len(targets):
+            await ctx.send("🎉 ไม่มีศัตรูเหลืออยู่แล้ว!")
+            return
+        await self._resolve_area(ctx, raid, attacker, targets, "ปล่อยพลังโจมตีวงกว้าง")
+
+    @commands.command(name='โจมตีหลายเป้า')
+    async def multi_attack(self, ctx, *names: str):
+        """โจมตีเป้าหมายที่ระบุพร้อมกันหลายตัว (ชื่อแรกเป็นตัวละครของตัวเองได้)"""
+        raid = get_raid(ctx.channel.id)
+        own = raid.get_characters_by_owner(ctx.author.id)
+        attacker_name = None
+        if names and raid.find(names[0]) in own:
+            attacker_name, names = names[0], names[1:]
+
+        attacker, error = self._pick_attacker(ctx, raid, attacker_name)
+        if error:
+            await ctx.send(error)
+            return
+
+        targets = [raid.find(name) for name in names]
+        if not names or any(
+            i is None or raid.hp[i] <= 0 or raid.is_hero[i] == raid.is_hero[attacker]
+            for i in targets
+        ):
+            await ctx.send("⚠️ เป้าหมายไม่ถูกต้อง! ใช้: !โจมตีหลายเป้า [ตัวละครของคุณ] <เป้า1> <เป้า2> ...")
+            return
+        await self._resolve_area(ctx, raid, attacker, np.unique(targets), "โจมตีหลายเป้าหมาย")
+
+    @commands.command(name='ฝูงโจมตี')
+    @commands.has_guild_permissions(manage_guild=True)
+    async def swarm_attack(self, ctx):
+        """(GM) ศัตรูที่ยังไม่ได้โจมตีในรอบนี้โจมตีฮีโร่แบบสุ่ม (ทอยแยกกัน)"""
+        raid = get_raid(ctx.channel.id)
+        n = raid.size
+        alive = raid.hp[:n] > 0
+        heroes = np.flatnonzero(alive & raid.is_hero[:n])
+        if not (alive & ~raid.is_hero[:n]).any() or not len(heroes):
+            await ctx.send("⛔ ต้องมีตัวละครทั้งสองฝ่ายในการจู่โจม!")
+            return
+        attackers = np.flatnonzero(alive & ~raid.is_hero[:n] & ~raid.acted[:n])
+        if not len(attackers):
+            await ctx.send(f"⏳ ฝูงศัตรูโจมตีไปแล้วในรอบที่ {raid.round}!")
+            return
+
+        rng = np.random.default_rng()
+        targets = rng.choice(heroes, size=len(attackers))
+        rolls = rng.integers(1, 21, size=len(attackers))
+        damage, hits = raid.resolve_attacks(attackers, targets, rolls, rng)
+        fallen = int((raid.hp[heroes] == 0).sum())
+
+        narrative = (
+            f"👹 ฝูงศัตรู {len(attackers)} ตัวบุกโจมตี: "
+            f"โดน {int(hits.sum())} ครั้ง รวม {int(damage.sum())} {HP_EMOJI}"
+        )
+        if fallen:
+            narrative += f"\n💀 ฝ่ายฮีโร่ล้ม {fallen} ตัว"
+        raid.add_narrative(narrative)
+        if raid.mark_acted(attackers) and not raid.check_raid_end():
+            raid.add_narrative(f"🔄 เริ่มรอบที่ {raid.round}")
+        await self._send_update(ctx, raid)
+
+    @commands.command(name='รอบใหม่')
+    @commands.has_guild_permissions(manage_guild=True)
+    async def force_new_round(self, ctx):
+        """(GM) เริ่มรอบใหม่ทันทีแม้ยังมีตัวละครที่ไม่ได้โจมตี"""
+        raid = raids.get(ctx.channel.id)
+        if not raid or not raid.size:
+            await ctx.send("ℹ️ ยังไม่มีการจู่โจม")
+            return
+
+        n = raid.size
+        waiting = int((~raid.acted[:n] & (raid.hp[:n] > 0)).sum())
+        raid.new_round()
+        raid.add_narrative(f"🔄 GM เริ่มรอบที่ {raid.round} (ข้าม {waiting} ตัวที่ยังไม่ได้โจมตี)")
+        await ctx.send(embed=raid.get_status_embed())
+
+    @commands.command(name='สถานะจู่โจม')
+    async def raid_status(self, ctx, page: int = 1):
+        """แสดงสถานะการจู่โจม (แบ่งหน้า)"""
+        raid = raids.get(ctx.channel.id)
+        if not raid or not raid.size:
+            await ctx.send("ℹ️ ยังไม่มีการจู่โจม")
+            return
+        await ctx.send(embed=raid.get_status_embed(page))
+
+    @commands.command(name='จบจู่โจม')
+    async def end_raid(self, ctx):
+        """จบการจู่โจม"""
+        raids.pop(ctx.channel.id, None)
+        await ctx.send("═══════════════\nการจู่โจมจบลง\n═══════════════")
+
+
+async def setup(bot):
+    await bot.add_cog(RaidCommands(bot))
@@ -0,0 +1,200 @@
+import discord
+import numpy as np
+from rules import HP_EMOJI, MP_EMOJI, MENTAL_EMOJI, CHARACTER_ICONS, CharacterType, Character
+
+# ลำดับประเภทตัวละครที่ใช้เป็น index ในอาเรย์
+CHARACTER_TYPES = list(CharacterType)
+HERO_TYPES = (CharacterType.HERO, CharacterType.ANTI_HERO)
+
+# จำนวนตัวละครต่อหน้าในสถานะการจู่โจม
+RAID_PAGE_SIZE = 10
+
+
+def build_type_matrix():
+    """สร้างตารางโบนัสประเภท [ผู้โจมตี, เป้าหมาย] จาก Character.calculate_attack_bonus"""
+    samples = [Character("", char_type, 1, 1, 0, 0) for char_type in CHARACTER_TYPES]
+    return np.array(
+        [[attacker.calculate_attack_bonus(target) for target in samples] for attacker in samples],
+        dtype=np.float64
+    )
+
+
+TYPE_MATRIX = build_type_matrix()
+
+
+# การจู่โจม: เก็บค่าสถานะของผู้ร่วมต่อสู้เป็นอาเรย์แยกตามค่า (structure of arrays)
+# เพื่อให้การโจมตีหลายเป้าหมายคำนวณได้ในรอบเดียวด้วย NumPy
+class Raid:
+    _ARRAYS = ('type_idx', 'is_hero', 'hp', 'max_hp', 'mp', 'max_mp', 'mental', 'speed', 'acted')
+
+    def __init__(self, capacity=64):
+        self.size = 0
+        self.names = []
+        self.owners = []
+        self.index = {}  # ชื่อตัวพิมพ์เล็ก -> ตำแหน่งในอาเรย์
+        self.type_idx = np.zeros(capacity, dtype=np.int8)
+        self.is_hero = np.zeros(capacity, dtype=bool)
+        self.hp = np.zeros(capacity, dtype=np.int64)
+        self.max_hp = np.zeros(capacity, dtype=np.int64)
+        self.mp = np.zeros(capacity, dtype=np.int64)
+        self.max_mp = np.zeros(capacity, dtype=np.int64)
+        self.mental = np.zeros(capacity, dtype=np.int64)
+        self.speed = np.zeros(capacity, dtype=np.int64)
+        self.acted = np.zeros(capacity, dtype=bool)  # โจมตีไปแล้วในรอบนี้
+        self.round = 1
+        self.narrative = []
+
+    def _reserve(self, count):
+        capacity = len(self.hp)
+        if self.size + count <= capacity:
+            return
+        while capacity < self.size + count:
+            capacity *= 2
+        for attr in self._ARRAYS:
+            old = getattr(self, attr)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:self.size] = old[:self.size]
+            setattr(self, attr, new)
+
+    def add_group(self, char_type, name, count, hp, mp, mental, speed, owner=None):
+        """เพิ่มตัวละครประเภทเดียวกันทีละหลายตัว (ชื่อจะต่อท้ายด้วยหมายเลขเมื่อ count > 1)"""
+        names = [name] if count == 1 else [f"{name}{i + 1}" for i in range(count)]
+        if any(n.lower() in self.index for n in names):
+            return None
+
+        self._reserve(count)
+        start, end = self.size, self.size + count
+        self.type_idx[start:end] = CHARACTER_TYPES.index(char_type)
+        self.is_hero[start:end] = char_type in HERO_TYPES
+        self.hp[start:end] = hp
+        self.max_hp[start:end] = hp
+        self.mp[start:end] = mp
+        self.max_mp[start:end] = mp
+        self.mental[start:end] = mental
+        self.speed[start:end] = speed
+        for i, n in enumerate(names, start):
+            self.index[n.lower()] = i
+        self.names.extend(names)
+        self.owners.extend([owner] * count)
+        self.size = end
+        return names
+
+    def find(self, name):
+        return self.index.get(name.lower())
+
+    def get_icon(self, i):
+        return CHARACTER_ICONS.get(CHARACTER_TYPES[self.type_idx[i]], "👤")
+
+    def get_characters_by_owner(self, user_id):
+        return [i for i, owner in enumerate(self.owners) if owner == user_id and self.hp[i] > 0]
+
+    def alive_enemies(self, attacker):
+        """ตำแหน่งของศัตรูที่ยังมีชีวิตของผู้โจมตี"""
+        n = self.size
+        mask = (self.hp[:n] > 0) & (self.is_hero[:n] != self.is_hero[attacker])
+        return np.flatnonzero(mask)
+
+    def mark_acted(self, indices):
+        """บันทึกว่าตัวละครโจมตีแล้ว ถ้าทุกตัวที่ยังมีชีวิตโจมตีครบจะขึ้นรอบใหม่ (คืน True)"""
+        self.acted[indices] = True
+        n = self.size
+        if (self.acted[:n] | (self.hp[:n] <= 0)).all():
+            self.new_round()
+            return True
+        return False
+
+    def new_round(self):
+        """เริ่มรอบใหม่ทันที ทุกตัวโจมตีได้อีกครั้ง"""
+        self.acted[:self.size] = False
+        self.round += 1
+
+    def resolve_attacks(self, attackers, targets, rolls, rng=None):
+        """คำนวณการโจมตีทุกคู่ (ผู้โจมตี, เป้าหมาย) ในรอบเดียว
+
+        ใช้กติกาเดียวกับ !โจมตี: ความเร็วกำหนดจำนวนครั้ง จิตใจกำหนดความแม่นยำ
+        MP เพิ่มความเสียหาย ทอย 20 ติดคริติคอล และคูณโบนัสประเภทตัวละคร
+        ผู้โจมตีเสีย MP ครั้งเดียวต่อการกระทำ คืน (ความเสียหาย, จำนวนครั้งที่โดน)
+        """
+        rng = rng or np.random.default_rng()
+        attackers = np.asarray(attackers)
+        targets = np.asarray(targets)
+        rolls = np.broadcast_to(np.asarray(rolls), targets.shape)
+
+        # ผลจากความเร็ว (โอกาสโจมตีหลายครั้ง)
+        speed_diff = self.speed[attackers] - self.speed[targets]
+        attack_count = 1 + (speed_diff > 10) + (speed_diff > 20)
+
+        # ผลจาก MP (เพิ่มความเสียหาย) และจิตใจ (ความแม่นยำ)
+        max_mp = self.max_mp[attackers]
+        mp_ratio = np.divide(self.mp[attackers], max_mp, out=np.zeros(len(attackers)), where=max_mp > 0)
+        mp_bonus = 1 + mp_ratio * 0.5
+        accuracy = np.clip(0.5 + self.mental[attackers] / 200, 0, 1)
+        hits = rng.binomial(attack_count, accuracy)
+
+        # ความเสียหายต่อครั้ง
+        per_hit = (np.maximum(1, rolls // 3) * mp_bonus).astype(np.int64)
+        per_hit[rolls == 20] *= 2
+        bonus = TYPE_MATRIX[self.type_idx[attackers], self.type_idx[targets]]
+        damage = (hits * per_hit * bonus).astype(np.int64)
+
+        np.subtract.at(self.hp, targets, damage)
+        np.maximum(self.hp, 0, out=self.hp)
+
+        # ลด MP หลังโจมตี
+        unique_attackers = np.unique(attackers)
+        mp_cost = np.maximum(5, (self.max_mp[unique_attackers] * 0.1).astype(np.int64))
+        self.mp[unique_attackers] = np.maximum(0, self.mp[unique_attackers] - mp_cost)
+
+        return damage, hits
+
+    def check_raid_end(self):
+        n = self.size
+        alive = self.hp[:n] > 0
+        if not (alive & self.is_hero[:n]).any():
+            return "ฝ่ายวายร้ายชนะ!"
+        elif not (alive & ~self.is_hero[:n]).any():
+            return "ฝ่ายฮีโร่ชนะ!"
+        return None
+
+    def add_narrative(self, text):
+        self.narrative.append(text)
+        if len(self.narrative) > 5:
+            self.narrative.pop(0)
+
+    def get_narrative(self):
+        return "\n".join(f"• {line}" for line in self.narrative[-3:]) if self.narrative else "การจู่โจมเริ่มต้นขึ้น..."
+
+    def get_team_summary(self, hero):
+        n = self.size
+        team = self.is_hero[:n] == hero
+        alive = team & (self.hp[:n] > 0)
+        hp = int(self.hp[:n][team].sum())
+        max_hp = int(self.max_hp[:n][team].sum())
+        return f"👥 {int(alive.sum())}/{int(team.sum())} ตัว | {HP_EMOJI} {hp}/{max_hp}"
+
+    def get_status_embed(self, page=1):
+        """สรุปภาพรวมทั้งสองฝ่าย และแสดงรายละเอียดทีละหน้า"""
+        embed = discord.Embed(title="🐉 สถานะการจู่โจม 🐉", color=0x00ff00)
+        embed.add_field(name="🛡️ ฝ่ายฮีโร่ 🛡️", value=self.get_team_summary(True), inline=True)
+        embed.add_field(name="💀 ฝ่ายวายร้าย 💀", value=self.get_team_summary(False), inline=True)
+
+        # เรียงผู้ที่ยังมีชีวิต: ฝ่ายฮีโร่ก่อน แล้วตาม HP น้อยไปมาก
+        n = self.size
+        alive = np.flatnonzero(self.hp[:n] > 0)
+        alive = alive[np.lexsort((self.hp[alive], ~self.is_hero[alive]))]
+
+        pages = max(1, -(-len(alive) // RAID_PAGE_SIZE))
+        page = min(max(1, page), pages)
+        lines = []
+        for i in alive[(page - 1) * RAID_PAGE_SIZE:page * RAID_PAGE_SIZE]:
+            lines.append(
+                f"{self.get_icon(i)} {self.names[i]} "
+                f"{HP_EMOJI} {self.hp[i]}/{self.max_hp[i]} "
+                f"{MP_EMOJI} {self.mp[i]}/{self.max_mp[i]} "
+                f"{MENTAL_EMOJI} {self.mental[i]}"
+                + (" ✔️" if self.acted[i] else "")
+            )
+        if lines:
+            embed.add_field(name="📋 ผู้ร่วมต่อสู้ (✔️ = โจมตีแล้วในรอบนี้)", value="\n".join(lines), inline=False)
+        embed.set_footer(text=f"รอบที่ {self.round} | หน้า {page}/{pages}")
+        return embed
@@ -0,0 +1,68 @@
+import raid
+import rules
+from collections import deque
+from timers import TimerWheel
+
+# ที่เก็บสถานะการต่อสู้ของแต่ละช่อง
+# โมดูลนี้ไม่ใช่ extension จึงไม่ถูกโหลดใหม่ตอน reload_extension
+# การต่อสู้ที่กำลังเล่นอยู่จึงยังคงอยู่หลังการรีโหลดคำสั่ง
+battles = {}
+raids = {}
+
+# วงล้อเวลาหมดตาที่ใช้ร่วมกันทุกช่อง และค่าตั้งเวลาที่แต่ละช่องกำหนดเอง
+turn_timers = TimerWheel()
+turn_settings = {}
+idle_streaks = {}  # จำนวนครั้งที่หมดเวลาติดกันของแต่ละช่อง
+
+
+def get_battle(channel_id):
+    """คืนการต่อสู้ของช่อง (สร้างใหม่ถ้ายังไม่มี)"""
+    battle = battles.get(channel_id)
+    if battle is None:
+        battle = rules.Battle()
+        battles[channel_id] = battle
+    return battle
+
+
+def get_raid(channel_id):
+    """คืนการจู่โจมของช่อง (สร้างใหม่ถ้ายังไม่มี)"""
+    raid_state = raids.get(channel_id)
+    if raid_state is None:
+        raid_state = raid.Raid()
+        raids[channel_id] = raid_state
+    return raid_state
+
+
+def get_turn_settings(channel_id):
+    """คืน (วินาทีต่อตา, การกระทำเมื่อหมดเวลา) ของช่อง"""
+    return turn_settings.get(channel_id, (rules.DEFAULT_TURN_TIMEOUT, rules.DEFAULT_TIMEOUT_ACTION))
+
+
+def set_turn_settings(channel_id, timeout, action):
+    turn_settings[channel_id] = (timeout, action)
+
+
+def rebind_rules():
+    """ผูกการต่อสู้ที่มีอยู่เข้ากับคลาสจาก rules และ raid ที่โหลดใหม่
+
+    importlib.reload สร้างคลาสและ Enum ชุดใหม่ ออบเจ็กต์เดิมจึงต้องเปลี่ยน
+    __class__ และ char_type ให้ชี้ไปที่ของใหม่ ไม่เช่นนั้นการเทียบประเภทจะผิด
+    """
+    count = 0
+    for battle in battles.values():
+        battle.__class__ = rules.Battle
+        # ปรับขนาดประวัติตาม HISTORY_DEPTH ใหม่ (เก็บ snapshot ล่าสุดไว้)
+        if battle.history.maxlen != rules.HISTORY_DEPTH + 1:
+            battle.history = deque(battle.history, maxlen=rules.HISTORY_DEPTH + 1)
+        # รวมตัวละครที่ถูกลบไปแล้วแต่ยังอยู่ในประวัติสำหรับ !ย้อนกลับ
+        chars = {char for roster, *_ in battle.history for char in roster}
+        chars.update(battle.participants)
+        for char in chars:
+            char.__class__ = rules.Character
+            char.char_type = rules.CharacterType[char.char_type.name]
+            char.effects = tuple(char.effects)
+        count += len(battle.participants)
+    for raid_state in raids.values():
+        raid_state.__class__ = raid.Raid
+        count += raid_state.size
+    return count
@@ -0,0 +1,286 @@
+import discord
+from collections import deque
+from enum import Enum
+
+# อิโมจิสำหรับแสดงสถานะ
+HP_EMOJI = '❤️'
+MP_EMOJI = '💠'
+MENTAL_EMOJI = '🧠'
+DICE_EMOJI = '🎲'
+
+# เวลาต่อตา (วินาที, 0 = ไม่จำกัด) และสิ่งที่ทำเมื่อผู้เล่นหมดเวลา (ผ่าน/โจมตี)
+DEFAULT_TURN_TIMEOUT = 0
+DEFAULT_TIMEOUT_ACTION = 'ผ่าน'
+
+# จำนวนครั้งสูงสุดที่ย้อนกลับได้ด้วย !ย้อนกลับ
+HISTORY_DEPTH = 20
+
+# ประเภทตัวละคร
+class CharacterType(Enum):
+    HERO = "ฮีโร่"
+    ANTI_HERO = "ผู้ไม่หวังดี"
+    VILLAIN = "วายร้าย"
+    MONSTER = "สัตว์ประหลาด"
+
+# ไอคอนของแต่ละประเภทตัวละคร
+CHARACTER_ICONS = {
+    CharacterType.HERO: "🦸",
+    CharacterType.ANTI_HERO: "🦹",
+    CharacterType.VILLAIN: "👿",
+    CharacterType.MONSTER: "👹"
+}
+
+# คลาสตัวละคร
+class Character:
+    # ค่าที่เก็บใน snapshot (ชื่อ ประเภท และทีมไม่เปลี่ยนจึงไม่ต้องเก็บ)
+    STATE_FIELDS = ('hp', 'max_hp', 'mp', 'max_mp', 'mental', 'speed', 'effects', 'owner', 'attack_count')
+    
+    def __init__(self, name, char_type, hp, mp, mental, speed):
+        self.name = name
+        self.char_type = char_type
+        self.max_hp = hp
+        self.hp = hp
+        self.max_mp = mp
+        self.mp = mp
+        self.mental = mental
+        self.speed = speed
+        self.effects = ()  # tuple เพื่อให้ทุกการแก้ไขผ่าน __setattr__ และถูกบันทึกใน snapshot
+        self.team = self._determine_team()
+        self.owner = None
+        self.attack_count = 1  # จำนวนครั้งที่โจมตีได้ในหนึ่งตา
+    
+    def __setattr__(self, name, value):
+        # แก้ค่าใน STATE_FIELDS แล้ว state tuple ที่แคชไว้จะใช้ไม่ได้อีก
+        object.__setattr__(self, name, value)
+        if name in Character.STATE_FIELDS:
+            object.__setattr__(self, '_state', None)
+    
+    def add_effect(self, effect):
+        """เพิ่มผลกระทบ"""
+        self.effects += (effect,)
+    
+    def get_state(self):
+        """ค่าที่เปลี่ยนได้ของตัวละครในรูป tuple
+
+        สร้างใหม่เฉพาะเมื่อค่าเปลี่ยนตั้งแต่ครั้งก่อน ตัวละครที่ไม่เปลี่ยนจะคืน tuple เดิม
+        snapshot หลายชุดจึงใช้ state เดียวกันร่วมกันโดยไม่ต้องคัดลอก
+        """
+        state = self.__dict__.get('_state')
+        if state is None:
+            state = (self.hp, self.max_hp, self.mp, self.max_mp, self.mental, self.speed,
+                     self.effects, self.owner, self.attack_count)
+            object.__setattr__(self, '_state', state)
+        return state
+    
+    def set_state(self, state):
+        (self.hp, self.max_hp, self.mp, self.max_mp, self.mental, self.speed,
+         self.effects, self.owner, self.attack_count) = state
+        # ค่าตรงกับ state แล้ว ใช้ tuple เดิมต่อได้
+        object.__setattr__(self, '_state', state)
+    
+    def _determine_team(self):
+        if self.char_type in [CharacterType.HERO, CharacterType.ANTI_HERO]:
+            return "ฝ่ายฮีโร่"
+        return "ฝ่ายวายร้าย"
+    
+    def get_icon(self):
+        return CHARACTER_ICONS.get(self.char_type, "👤")
+    
+    def calculate_attack_bonus(self, target):
+        """คำนวณโบนัสการโจมตีตามประเภทตัวละคร"""
+        type_advantages = {
+            CharacterType.HERO: {
+                'strong_against': [CharacterType.VILLAIN],
+                'weak_against': [CharacterType.ANTI_HERO]
+            },
+            CharacterType.ANTI_HERO: {
+                'strong_against': [CharacterType.HERO],
+                'weak_against': [CharacterType.MONSTER]
+            },
+            CharacterType.VILLAIN: {
+                'strong_against': [CharacterType.ANTI_HERO],
+                'weak_against': [CharacterType.HERO]
+            },
+            CharacterType.MONSTER: {
+                'strong_against': [CharacterType.ANTI_HERO],
+                'weak_against': [CharacterType.VILLAIN]
+            }
+        }
+        
+        advantage = type_advantages.get(self.char_type, {})
+        
+        if target.char_type in advantage.get('strong_against', []):
+            return 1.5  # โจมตีได้แรงขึ้น 50%
+        elif target.char_type in advantage.get('weak_against', []):
+            return 0.7  # โจมตีได้อ่อนลง 30%
+        return 1.0  # ไม่มีผล
+
+# คลาสการต่อสู้
+class Battle:
+    def __init__(self):
+        self.participants = []
+        self.turn_order = []
+        self.current_turn = 0
+        self.is_active = False
+        self.narrative = []
+        self.history = deque(maxlen=HISTORY_DEPTH + 1)  # สถานะล่าสุด + สถานะที่ย้อนกลับได้
+        self.take_snapshot()
+    
+    def take_snapshot(self, replace=False):
+        """บันทึกสถานะการต่อสู้ (เรียกทุกครั้งที่เปลี่ยนตาหรือแก้รายชื่อตัวละคร)
+
+        replace=True เขียนทับ snapshot ล่าสุดแทนการเพิ่มใหม่ ใช้กับการข้ามตาอัตโนมัติ
+        ที่ไม่มีอะไรเปลี่ยนนอกจากลำดับตา เพื่อไม่ให้ดันประวัติที่ GM ต้องการออกไป
+
+        แต่ละ snapshot เก็บ tuple ของตัวละครและ state tuple ของแต่ละตัว (อ้างอิงอย่างเดียว)
+        ตัวละครที่ไม่ถูกแก้ไขใช้ state tuple เดิมร่วมกับ snapshot ก่อนหน้า
+        และถ้ารายชื่อไม่เปลี่ยนก็ใช้ tuple รายชื่อเดิมด้วย
+        """
+        roster = tuple(self.participants)
+        if self.history and self.history[-1][0] == roster:
+            roster = self.history[-1][0]
+        states = tuple(char.get_state() for char in roster)
+        if replace and self.history:
+            self.history.pop()
+        self.history.append((
+            roster,
+            states,
+            tuple(self.turn_order),
+            self.current_turn,
+            self.is_active,
+            tuple(self.narrative)
+        ))
+    
+    def undo(self, steps=1):
+        """ย้อนกลับไป steps snapshot คืน False ถ้าประวัติไม่พอ"""
+        if steps < 1 or steps >= len(self.history):
+            return False
+        for _ in range(steps):
+            self.history.pop()
+        
+        roster, states, turn_order, current_turn, is_active, narrative = self.history[-1]
+        for char, state in zip(roster, states):
+            if char.get_state() is not state:
+                char.set_state(state)
+        self.participants = list(roster)
+        self.turn_order = list(turn_order)
+        self.current_turn = current_turn
+        self.is_active = is_active
+        self.narrative = list(narrative)
+        return True
+    
+    def add_participant(self, character):
+        self.participants.append(character)
+        self.update_turn_order()
+    
+    def update_turn_order(self):
+        self.turn_order = sorted(self.participants, key=lambda x: x.speed, reverse=True)
+    
+    def next_turn(self):
+        self.current_turn = (self.current_turn + 1) % len(self.turn_order)
+        return self.turn_order[self.current_turn]
+    
+    def get_target(self, target_name):
+        for char in self.participants:
+            if char.name.lower() == target_name.lower():
+                return char
+        return None
+    
+    def get_characters_by_owner(self, user_id):
+        return [char for char in self.participants if char.owner == user_id]
+    
+    def get_team_members(self, team_name):
+        return [char for char in self.participants if char.team == team_name and char.hp > 0]
+    
+    def get_status_emoji(self, current, max):
+        filled = round(current / max * 10) if max > 0 else 0
+        return '🟥' * filled + '⬛' * (10 - filled)
+    
+    def get_status_embed(self):
+        embed = discord.Embed(title="⚔️ สถานะการต่อสู้ ⚔️", color=0x00ff00)
+        
+        heroes = self.get_team_members("ฝ่ายฮีโร่")
+        if heroes:
+            hero_status = []
+            for char in heroes:
+                status = f"{char.get_icon()} {char.name} ({char.char_type.value})\n"
+                status += f"{HP_EMOJI} {char.hp}/{char.max_hp} {self.get_status_emoji(char.hp, char.max_hp)}\n"
+                status += f"{MP_EMOJI} {char.mp}/{char.max_mp} {self.get_status_emoji(char.mp, char.max_mp)}\n"
+                status += f"{MENTAL_EMOJI} {char.mental}/100"
+                if char.effects:
+                    status += f"\n🔮 ผลกระทบ: {', '.join(char.effects)}"
+                hero_status.append(status)
+            
+            embed.add_field(name="🛡️ ฝ่ายฮีโร่ 🛡️", value="\n\n".join(hero_status), inline=False)
+        
+        villains = self.get_team_members("ฝ่ายวายร้าย")
+        if villains:
+            villain_status = []
+            for char in villains:
+                status = f"{char.get_icon()} {char.name} ({char.char_type.value})\n"
+                status += f"{HP_EMOJI} {char.hp}/{char.max_hp} {self.get_status_emoji(char.hp, char.max_hp)}\n"
+                status += f"{MP_EMOJI} {char.mp}/{char.max_mp} {self.get_status_emoji(char.mp, char.max_mp)}\n"
+                status += f"{MENTAL_EMOJI} {char.mental}/100"
+                if char.effects:
+                    status += f"\n🔮 ผลกระทบ: {', '.join(char.effects)}"
+                villain_status.append(status)
+            
+            embed.add_field(name="💀 ฝ่ายวายร้าย 💀", value="\n\n".join(villain_status), inline=False)
+        
+        if self.turn_order:
+            current_char = self.turn_order[self.current_turn]
+            embed.set_footer(text=f"ตาปัจจุบัน: {current_char.get_icon()} {current_char.name}")
+        
+        return embed
+    
+    def check_battle_end(self):
+        heroes_alive = any(char.team == "ฝ่ายฮีโร่" and char.hp > 0 for char in self.participants)
+        villains_alive = any(char.team == "ฝ่ายวายร้าย" and char.hp > 0 for char in self.participants)
+        
+        if not heroes_alive:
+            return "ฝ่ายวายร้ายชนะ!"
+        elif not villains_alive:
+            return "ฝ่ายฮีโร่ชนะ!"
+        return None
+    
+    def add_narrative(self, text):
+        self.narrative.append(text)
+        if len(self.narrative) > 5:
+            self.narrative.pop(0)
+    
+    def get_narrative(self):
+        return "\n".join(f"• {line}" for line in self.narrative[-3:]) if self.narrative else "การต่อสู้เริ่มต้นขึ้น..."
+    def add_participant(self, character):
+        """เพิ่มตัวละครและอัพเดทลำดับการเล่น"""
+        self.participants.append(character)
+        self.update_turn_order()
+        
+        # ถ้าการต่อสู้เริ่มแล้วและนี่เป็นตัวละครแรกของทีม
+        if self.is_active:
+            team = character.team
+            team_members = self.get_team_members(team)
+            if len(team_members) == 1:
+                self.add_narrative(f"⚔️ {character.get_icon()} {character.name} เข้าร่วมการต่อสู้เป็นฝ่าย {team}!")
+    
+    def update_turn_order(self):
+        """อัพเดทลำดับการเล่นโดยเรียงตามความเร็ว"""
+        # กรองเฉพาะตัวละครที่ HP > 0
+        alive_participants = [char for char in self.participants if char.hp > 0]
+        
+        # เรียงลำดับใหม่
+        self.turn_order = sorted(alive_participants, key=lambda x: x.speed, reverse=True)
+        
+        # ปรับ current_turn ให้อยู่ในขอบเขตที่ถูกต้อง
+        if self.turn_order and self.current_turn >= len(self.turn_order):
+            self.current_turn = max(0, len(self.turn_order) - 1)
+    def apply_mental_effects(self, attacker, defender):
+        """ประมวลผลผลกระทบจากจิตใจ"""
+        mental_diff = attacker.mental - defender.mental
+        
+        # ถ้าจิตใจแตกต่างมากกว่า 30 หน่วย
+        if mental_diff > 30:
+            defender.add_effect("หวาดกลัว")
+            self.add_narrative(f"😨 {defender.name} รู้สึกหวาดกลัวจากความต่างของจิตใจ!")
+        elif mental_diff < -30:
+            attacker.add_effect("ลังเล")
+            self.add_narrative(f"🤔 {attacker.name} ลังเลเนื่องจากจิตใจต่ำกว่าเป้าหมาย!")
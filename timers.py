@@ -0,0 +1,75 @@
+import asyncio
+import math
+
+
+# วงล้อเวลา (hashed timer wheel) ที่ใช้ร่วมกันทุกการต่อสู้
+# มี task เดียวหมุนทีละ tick และตรวจเฉพาะช่องของ tick นั้น
+# การตั้ง/ยกเลิกเวลาเป็น O(1) จึงรองรับกำหนดเวลาจำนวนมากได้โดยแทบไม่กิน CPU
+class TimerWheel:
+    def __init__(self, tick=1.0, slots=512):
+        self.tick = tick
+        self.slots = [{} for _ in range(slots)]  # key -> จำนวนรอบที่ต้องรออีก
+        self.entries = {}  # key -> ช่องที่อยู่
+        self.position = 0
+        self.handler = None  # coroutine function ที่รับ key เมื่อหมดเวลา
+        self._task = None
+        self._handler_tasks = set()  # เก็บอ้างอิงไว้ไม่ให้ task ถูก garbage collect ระหว่างทำงาน
+
+    def __len__(self):
+        return len(self.entries)
+
+    def schedule(self, key, delay):
+        """ตั้งเวลาให้ key (ถ้ามีอยู่แล้วจะเริ่มนับใหม่)"""
+        self.cancel(key)
+        ticks = max(1, math.ceil(delay / self.tick))
+        slot = (self.position + ticks) % len(self.slots)
+        self.slots[slot][key] = (ticks - 1) // len(self.slots)
+        self.entries[key] = slot
+
+    def cancel(self, key):
+        """ยกเลิกเวลาของ key"""
+        slot = self.entries.pop(key, None)
+        if slot is not None:
+            del self.slots[slot][key]
+
+    def is_pending(self, key):
+        return key in self.entries
+
+    def advance(self):
+        """หมุนไปหนึ่ง tick และคืนรายการ key ที่หมดเวลา"""
+        self.position = (self.position + 1) % len(self.slots)
+        bucket = self.slots[self.position]
+        expired = []
+        for key, rounds in bucket.items():
+            if rounds == 0:
+                expired.append(key)
+            else:
+                bucket[key] = rounds - 1
+        for key in expired:
+            del bucket[key]
+            del self.entries[key]
+        return expired
+
+    def start(self):
+        """เริ่ม task หมุนวงล้อ (เรียกซ้ำได้ จะมีแค่ task เดียว)"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time() + self.tick
+        while True:
+            await asyncio.sleep(max(0, next_tick - loop.time()))
+            # ถ้า event loop ช้า ให้หมุนให้ทันเวลาจริง
+            while next_tick <= loop.time():
+                next_tick += self.tick
+                for key in self.advance():
+                    if self.handler is not None:
+                        task = loop.create_task(self.handler(key))
+                        self._handler_tasks.add(task)
+                        task.add_done_callback(self._handler_tasks.discard)